@@ -104,7 +104,7 @@ func (hc *HttpController) HandleAccountList(rawRequest *map[string]interface{},
 	}
 
 	// Accounts list
-	_, accounts, err := hc.Wallet.AccountsList(dbWallet, count)
+	accounts, err := hc.Wallet.AccountsList(dbWallet, count)
 	if errors.Is(err, wallet.ErrWalletLocked) {
 		ErrWalletLocked(w, r)
 		return
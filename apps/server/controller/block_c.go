@@ -26,19 +26,19 @@ func (hc *HttpController) HandleReceiveRequest(rawRequest *map[string]interface{
 		return
 	}
 
-	// See if wallet exists
-	dbWallet := hc.WalletExists(receiveRequest.Wallet, w, r)
-	if dbWallet == nil {
-		return
-	}
-
-	// Validate account
+	// Validate account before touching the database
 	_, err := utils.AddressToPub(receiveRequest.Account, hc.Wallet.Config.Wallet.Banano)
 	if err != nil {
 		ErrInvalidAccount(w, r)
 		return
 	}
 
+	// See if wallet exists
+	dbWallet := hc.WalletExists(receiveRequest.Wallet, w, r)
+	if dbWallet == nil {
+		return
+	}
+
 	// Accounts list
 	resp, err := hc.Wallet.CreateAndPublishReceiveBlock(dbWallet, receiveRequest.Account, receiveRequest.Block, receiveRequest.Work, receiveRequest.BpowKey)
 	if err != nil {
@@ -68,7 +68,7 @@ func (hc *HttpController) HandleReceiveAllRequest(rawRequest *map[string]interfa
 	}
 
 	// Accounts list
-	_, accounts, err := hc.Wallet.AccountsList(dbWallet, 0)
+	accounts, err := hc.Wallet.AccountsList(dbWallet, 0)
 	if errors.Is(err, wallet.ErrWalletLocked) {
 		ErrWalletLocked(w, r)
 		return
@@ -107,13 +107,7 @@ func (hc *HttpController) HandleSendRequest(rawRequest *map[string]interface{},
 		return
 	}
 
-	// See if wallet exists
-	dbWallet := hc.WalletExists(sendRequest.Wallet, w, r)
-	if dbWallet == nil {
-		return
-	}
-
-	// Validate accounts
+	// Validate accounts before touching the database
 	_, err := utils.AddressToPub(sendRequest.Source, hc.Wallet.Config.Wallet.Banano)
 	if err != nil {
 		ErrBadRequest(w, r, fmt.Sprintf("Invalid source account %s", sendRequest.Source))
@@ -125,6 +119,12 @@ func (hc *HttpController) HandleSendRequest(rawRequest *map[string]interface{},
 		return
 	}
 
+	// See if wallet exists
+	dbWallet := hc.WalletExists(sendRequest.Wallet, w, r)
+	if dbWallet == nil {
+		return
+	}
+
 	// Do the send
 	resp, err := hc.Wallet.CreateAndPublishSendBlock(dbWallet, sendRequest.Amount, sendRequest.Source, sendRequest.Destination, sendRequest.ID, sendRequest.Work, sendRequest.BpowKey)
 	if err != nil {
@@ -152,13 +152,7 @@ func (hc *HttpController) HandleAccountRepresentativeSetRequest(rawRequest *map[
 		return
 	}
 
-	// See if wallet exists
-	dbWallet := hc.WalletExists(changeRequest.Wallet, w, r)
-	if dbWallet == nil {
-		return
-	}
-
-	// Validate accounts
+	// Validate accounts before touching the database
 	_, err := utils.AddressToPub(changeRequest.Account, hc.Wallet.Config.Wallet.Banano)
 	if err != nil {
 		ErrBadRequest(w, r, "Invalid account")
@@ -170,6 +164,12 @@ func (hc *HttpController) HandleAccountRepresentativeSetRequest(rawRequest *map[
 		return
 	}
 
+	// See if wallet exists
+	dbWallet := hc.WalletExists(changeRequest.Wallet, w, r)
+	if dbWallet == nil {
+		return
+	}
+
 	// Do the send
 	resp, err := hc.Wallet.CreateAndPublishChangeBlock(dbWallet, changeRequest.Account, changeRequest.Representative, changeRequest.Work, changeRequest.BpowKey, false)
 	if err != nil {
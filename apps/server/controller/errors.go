@@ -1,6 +1,8 @@
 package controller
 
 import (
+	"bytes"
+	"encoding/json"
 	"net/http"
 
 	"github.com/go-chi/render"
@@ -10,94 +12,132 @@ type ErrorResponse struct {
 	Error string `json:"error"`
 }
 
+// Errors with a fixed message are encoded once at startup, the same way render.JSON would encode them
+// Writing them is then just headers + a byte slice, no per-response marshalling
+func encodeErrorResponse(e *ErrorResponse) []byte {
+	buf := &bytes.Buffer{}
+	enc := json.NewEncoder(buf)
+	enc.SetEscapeHTML(true)
+	if err := enc.Encode(e); err != nil {
+		panic(err)
+	}
+	return buf.Bytes()
+}
+
+func writeStaticError(w http.ResponseWriter, status int, body []byte) {
+	w.Header().Set("Content-Type", "application/json")
+	w.WriteHeader(status)
+	w.Write(body)
+}
+
 var UnableToParseJsonError = ErrorResponse{
 	Error: "Unable to parse json",
 }
 
+var unableToParseJsonErrorBody = encodeErrorResponse(&UnableToParseJsonError)
+
 func ErrUnableToParseJson(w http.ResponseWriter, r *http.Request) {
-	render.Status(r, http.StatusBadRequest)
-	render.JSON(w, r, &UnableToParseJsonError)
+	writeStaticError(w, http.StatusBadRequest, unableToParseJsonErrorBody)
 }
 
 var InvalidSeedError = ErrorResponse{
 	Error: "Invalid seed",
 }
 
+var invalidSeedErrorBody = encodeErrorResponse(&InvalidSeedError)
+
 func ErrInvalidSeed(w http.ResponseWriter, r *http.Request) {
-	render.Status(r, http.StatusBadRequest)
-	render.JSON(w, r, &InvalidSeedError)
+	writeStaticError(w, http.StatusBadRequest, invalidSeedErrorBody)
 }
 
 var WalletNotFoundError = ErrorResponse{
 	Error: "wallet not found",
 }
 
+var walletNotFoundErrorBody = encodeErrorResponse(&WalletNotFoundError)
+
 func ErrWalletNotFound(w http.ResponseWriter, r *http.Request) {
-	render.Status(r, http.StatusBadRequest)
-	render.JSON(w, r, &WalletNotFoundError)
+	writeStaticError(w, http.StatusBadRequest, walletNotFoundErrorBody)
 }
 
 var WalletLockedError = ErrorResponse{
 	Error: "wallet locked",
 }
 
+var walletLockedErrorBody = encodeErrorResponse(&WalletLockedError)
+
 func ErrWalletLocked(w http.ResponseWriter, r *http.Request) {
-	render.Status(r, http.StatusBadRequest)
-	render.JSON(w, r, &WalletLockedError)
+	writeStaticError(w, http.StatusBadRequest, walletLockedErrorBody)
 }
 
 var WalletNotLockedError = ErrorResponse{
 	Error: "wallet not locked",
 }
 
+var walletNotLockedErrorBody = encodeErrorResponse(&WalletNotLockedError)
+
 func ErrWalletNotLocked(w http.ResponseWriter, r *http.Request) {
-	render.Status(r, http.StatusBadRequest)
-	render.JSON(w, r, &WalletNotLockedError)
+	writeStaticError(w, http.StatusBadRequest, walletNotLockedErrorBody)
 }
 
 var InvalidKeyError = ErrorResponse{
 	Error: "Invalid key",
 }
 
+var invalidKeyErrorBody = encodeErrorResponse(&InvalidKeyError)
+
 func ErrInvalidKey(w http.ResponseWriter, r *http.Request) {
-	render.Status(r, http.StatusBadRequest)
-	render.JSON(w, r, &InvalidKeyError)
+	writeStaticError(w, http.StatusBadRequest, invalidKeyErrorBody)
 }
 
 var WalletNoPasswordError = ErrorResponse{
 	Error: "password not set",
 }
 
+var walletNoPasswordErrorBody = encodeErrorResponse(&WalletNoPasswordError)
+
 func ErrNoWalletPassword(w http.ResponseWriter, r *http.Request) {
-	render.Status(r, http.StatusBadRequest)
-	render.JSON(w, r, &WalletNoPasswordError)
+	writeStaticError(w, http.StatusBadRequest, walletNoPasswordErrorBody)
 }
 
 var InvalidHashError = ErrorResponse{
 	Error: "Invalid hash",
 }
 
+var invalidHashErrorBody = encodeErrorResponse(&InvalidHashError)
+
 func ErrInvalidHash(w http.ResponseWriter, r *http.Request) {
-	render.Status(r, http.StatusBadRequest)
-	render.JSON(w, r, &InvalidHashError)
+	writeStaticError(w, http.StatusBadRequest, invalidHashErrorBody)
 }
 
 var WorkFailedError = ErrorResponse{
 	Error: "Failed to generate work",
 }
 
+var workFailedErrorBody = encodeErrorResponse(&WorkFailedError)
+
 func ErrWorkFailed(w http.ResponseWriter, r *http.Request) {
-	render.Status(r, http.StatusInternalServerError)
-	render.JSON(w, r, &WorkFailedError)
+	writeStaticError(w, http.StatusInternalServerError, workFailedErrorBody)
 }
 
 var InvalidAccountError = ErrorResponse{
 	Error: "Invalid account",
 }
 
+var invalidAccountErrorBody = encodeErrorResponse(&InvalidAccountError)
+
 func ErrInvalidAccount(w http.ResponseWriter, r *http.Request) {
-	render.Status(r, http.StatusBadRequest)
-	render.JSON(w, r, &InvalidAccountError)
+	writeStaticError(w, http.StatusBadRequest, invalidAccountErrorBody)
+}
+
+var NotImplementedError = ErrorResponse{
+	Error: "not_implemented",
+}
+
+var notImplementedErrorBody = encodeErrorResponse(&NotImplementedError)
+
+func ErrNotImplemented(w http.ResponseWriter, r *http.Request) {
+	writeStaticError(w, http.StatusBadRequest, notImplementedErrorBody)
 }
 
 func ErrInternalServerError(w http.ResponseWriter, r *http.Request, errorText string) {
@@ -212,3 +212,21 @@ func TestErrInvalidAccount(t *testing.T) {
 
 	assert.Equal(t, "Invalid account", respJson["error"])
 }
+
+func TestErrNotImplemented(t *testing.T) {
+	w := httptest.NewRecorder()
+	// Build request
+	req := httptest.NewRequest("GET", "/", nil)
+	req.Header.Set("Content-Type", "application/json")
+	ErrNotImplemented(w, req)
+	resp := w.Result()
+	defer resp.Body.Close()
+	assert.Equal(t, 400, resp.StatusCode)
+	assert.Equal(t, "application/json", resp.Header.Get("Content-Type"))
+
+	var respJson map[string]interface{}
+	respBody, _ := io.ReadAll(resp.Body)
+	json.Unmarshal(respBody, &respJson)
+
+	assert.Equal(t, "not_implemented", respJson["error"])
+}
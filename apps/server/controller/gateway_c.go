@@ -1,16 +1,34 @@
 package controller
 
 import (
+	"bytes"
 	"encoding/json"
+	"errors"
 	"fmt"
+	"io"
 	"net/http"
 	"strings"
 
 	"github.com/appditto/pippin_nano_wallet/libs/log"
-	"golang.org/x/exp/slices"
 )
 
-var UNSUPPORTED_WALLET_ACTIONS = []string{"account_move", "account_remove", "receive_minimum", "receive_minimum_set", "search_pending", "search_pending_all", "wallet_add_watch", "wallet_export", "wallet_history", "wallet_ledger", "wallet_republish", "wallet_work_get", "work_get", "work_set"}
+// Set of wallet actions we intentionally don't support, looked up on every request
+var UNSUPPORTED_WALLET_ACTIONS = map[string]struct{}{
+	"account_move":        {},
+	"account_remove":      {},
+	"receive_minimum":     {},
+	"receive_minimum_set": {},
+	"search_pending":      {},
+	"search_pending_all":  {},
+	"wallet_add_watch":    {},
+	"wallet_export":       {},
+	"wallet_history":      {},
+	"wallet_ledger":       {},
+	"wallet_republish":    {},
+	"wallet_work_get":     {},
+	"work_get":            {},
+	"work_set":            {},
+}
 
 // This is called the "Gateway" because it's the entry point for all requests
 // This API is intended to replace the nano node wallet RPCs
@@ -23,22 +41,35 @@ var UNSUPPORTED_WALLET_ACTIONS = []string{"account_move", "account_remove", "rec
 // The node isn't exactly great at returning errors, and the error messages are not very helpful
 // But as we want to be a drop-in replacement we mimic the behavior
 func (hc *HttpController) Gateway(w http.ResponseWriter, r *http.Request) {
+	// Keep the raw body, requests we don't handle are forwarded to the node untouched
+	rawRequest, err := io.ReadAll(r.Body)
+	if err != nil {
+		log.Errorf("Error reading http base request %s", err)
+		ErrUnableToParseJson(w, r)
+		return
+	}
 	var baseRequest map[string]interface{}
-	if err := json.NewDecoder(r.Body).Decode(&baseRequest); err != nil {
+	if err := json.Unmarshal(rawRequest, &baseRequest); err != nil {
 		log.Errorf("Error unmarshalling http base request %s", err)
 		ErrUnableToParseJson(w, r)
 		return
 	}
 
-	if _, ok := baseRequest["action"]; !ok {
+	rawAction, ok := baseRequest["action"]
+	if !ok {
 		ErrUnableToParseJson(w, r)
 		return
 	}
 
-	action := strings.ToLower(fmt.Sprintf("%v", baseRequest["action"]))
+	// Action is a string in practice, only go through fmt for anything else
+	actionStr, ok := rawAction.(string)
+	if !ok {
+		actionStr = fmt.Sprintf("%v", rawAction)
+	}
+	action := strings.ToLower(actionStr)
 
-	if slices.Contains(UNSUPPORTED_WALLET_ACTIONS, action) {
-		ErrBadRequest(w, r, "not_implemented")
+	if _, ok := UNSUPPORTED_WALLET_ACTIONS[action]; ok {
+		ErrNotImplemented(w, r)
 		return
 	}
 
@@ -113,11 +144,68 @@ func (hc *HttpController) Gateway(w http.ResponseWriter, r *http.Request) {
 		hc.HandleWalletChangeSeedRequest(&baseRequest, w, r)
 		return
 	default:
-		resp, err := hc.RpcClient.MakeRequest(baseRequest)
+		// The node reads the first of a duplicated key while we read the last,
+		// forwarding such a body could run an action other than the one we checked
+		if duplicate, err := hasDuplicateTopLevelKey(rawRequest); err != nil || duplicate {
+			ErrUnableToParseJson(w, r)
+			return
+		}
+		resp, err := hc.RpcClient.MakeRawRequest(rawRequest)
 		if err != nil {
 			ErrInternalServerError(w, r, "Error forwarding request to node")
+			return
 		}
 		w.Header().Set("Content-Type", "application/json")
 		w.Write(resp)
 	}
 }
+
+// Reports whether a key appears more than once at the top level of a JSON object
+// Walks the tokens once, so the body can still be forwarded without re-encoding it
+func hasDuplicateTopLevelKey(raw []byte) (bool, error) {
+	dec := json.NewDecoder(bytes.NewReader(raw))
+	if tok, err := dec.Token(); err != nil {
+		return false, err
+	} else if tok != json.Delim('{') {
+		return false, errors.New("expected a json object")
+	}
+	seen := make(map[string]struct{})
+	for dec.More() {
+		tok, err := dec.Token()
+		if err != nil {
+			return false, err
+		}
+		key, ok := tok.(string)
+		if !ok {
+			return false, errors.New("expected an object key")
+		}
+		if _, ok := seen[key]; ok {
+			return true, nil
+		}
+		seen[key] = struct{}{}
+		if err := skipJsonValue(dec); err != nil {
+			return false, err
+		}
+	}
+	return false, nil
+}
+
+// Consumes the next value, including any nested objects or arrays
+func skipJsonValue(dec *json.Decoder) error {
+	depth := 0
+	for {
+		tok, err := dec.Token()
+		if err != nil {
+			return err
+		}
+		switch tok {
+		case json.Delim('{'), json.Delim('['):
+			depth++
+		case json.Delim('}'), json.Delim(']'):
+			depth--
+		}
+		if depth == 0 {
+			return nil
+		}
+	}
+}
@@ -5,6 +5,7 @@ import (
 	"context"
 	"encoding/json"
 	"io"
+	"net/http"
 	"net/http/httptest"
 	"os"
 	"testing"
@@ -15,6 +16,7 @@ import (
 	"github.com/appditto/pippin_nano_wallet/libs/pow"
 	"github.com/appditto/pippin_nano_wallet/libs/rpc"
 	"github.com/appditto/pippin_nano_wallet/libs/wallet"
+	"github.com/jarcoal/httpmock"
 	"github.com/stretchr/testify/assert"
 )
 
@@ -116,3 +118,80 @@ func TestUnsupportedAction(t *testing.T) {
 
 	assert.Equal(t, "not_implemented", respJson["error"])
 }
+
+func TestProxyAction(t *testing.T) {
+	httpmock.Activate()
+	defer httpmock.DeactivateAndReset()
+
+	// Request JSON
+	body := []byte(`{"action":"block_count","include_cemented":"true"}`)
+
+	httpmock.RegisterResponder("POST", "http://localhost:123456",
+		func(req *http.Request) (*http.Response, error) {
+			// The request is forwarded as it was received
+			reqBody, _ := io.ReadAll(req.Body)
+			assert.Equal(t, body, reqBody)
+			return httpmock.NewStringResponse(200, `{"count":"1000","unchecked":"10","cemented":"999"}`), nil
+		},
+	)
+
+	w := httptest.NewRecorder()
+	// Build request
+	req := httptest.NewRequest("POST", "/", bytes.NewReader(body))
+	req.Header.Set("Content-Type", "application/json")
+	MockController.Gateway(w, req)
+	resp := w.Result()
+	defer resp.Body.Close()
+	assert.Equal(t, 200, resp.StatusCode)
+	assert.Equal(t, "application/json", resp.Header.Get("Content-Type"))
+
+	respBody, _ := io.ReadAll(resp.Body)
+	assert.Equal(t, `{"count":"1000","unchecked":"10","cemented":"999"}`, string(respBody))
+}
+
+func TestProxyDuplicateAction(t *testing.T) {
+	httpmock.Activate()
+	defer httpmock.DeactivateAndReset()
+
+	httpmock.RegisterResponder("POST", "http://localhost:123456",
+		func(req *http.Request) (*http.Response, error) {
+			return httpmock.NewStringResponse(200, `{"count":"1000"}`), nil
+		},
+	)
+
+	// We see block_count (last key wins), the node would see wallet_export (first key wins)
+	body := []byte(`{"action":"wallet_export","action":"block_count"}`)
+	w := httptest.NewRecorder()
+	// Build request
+	req := httptest.NewRequest("POST", "/", bytes.NewReader(body))
+	req.Header.Set("Content-Type", "application/json")
+	MockController.Gateway(w, req)
+	resp := w.Result()
+	defer resp.Body.Close()
+	assert.Equal(t, 400, resp.StatusCode)
+	assert.Equal(t, 0, httpmock.GetTotalCallCount())
+
+	var respJson map[string]interface{}
+	respBody, _ := io.ReadAll(resp.Body)
+	json.Unmarshal(respBody, &respJson)
+
+	assert.Equal(t, "Unable to parse json", respJson["error"])
+}
+
+func TestHasDuplicateTopLevelKey(t *testing.T) {
+	duplicate, err := hasDuplicateTopLevelKey([]byte(`{"action":"block_count","nested":{"action":"x","list":[{"action":"y"}]}}`))
+	assert.Nil(t, err)
+	assert.False(t, duplicate)
+
+	duplicate, err = hasDuplicateTopLevelKey([]byte(`{"action":"block_count","x":[1,2],"action":"send"}`))
+	assert.Nil(t, err)
+	assert.True(t, duplicate)
+
+	// Escaped keys are compared after decoding
+	duplicate, err = hasDuplicateTopLevelKey([]byte(`{"action":"block_count","act\u0069on":"send"}`))
+	assert.Nil(t, err)
+	assert.True(t, duplicate)
+
+	_, err = hasDuplicateTopLevelKey([]byte(`["action"]`))
+	assert.NotNil(t, err)
+}
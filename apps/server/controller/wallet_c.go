@@ -206,7 +206,7 @@ func (hc *HttpController) HandleWalletBalances(rawRequest *map[string]interface{
 	}
 
 	// Get accounts on wallet
-	_, accounts, err := hc.Wallet.AccountsList(dbWallet, math.MaxInt)
+	accounts, err := hc.Wallet.AccountsList(dbWallet, math.MaxInt)
 	if err != nil {
 		ErrInternalServerError(w, r, err.Error())
 		return
@@ -237,7 +237,7 @@ func (hc *HttpController) HandleWalletFrontiers(rawRequest *map[string]interface
 	}
 
 	// Get accounts on wallet
-	_, accounts, err := hc.Wallet.AccountsList(dbWallet, math.MaxInt)
+	accounts, err := hc.Wallet.AccountsList(dbWallet, math.MaxInt)
 	if err != nil {
 		ErrInternalServerError(w, r, err.Error())
 		return
@@ -268,7 +268,7 @@ func (hc *HttpController) HandleWalletPending(rawRequest *map[string]interface{}
 	}
 
 	// Get accounts on wallet
-	_, accounts, err := hc.Wallet.AccountsList(dbWallet, math.MaxInt)
+	accounts, err := hc.Wallet.AccountsList(dbWallet, math.MaxInt)
 	if err != nil {
 		ErrInternalServerError(w, r, err.Error())
 		return
@@ -299,7 +299,7 @@ func (hc *HttpController) HandleWalletInfo(rawRequest *map[string]interface{}, w
 	}
 
 	// Get accounts on wallet
-	_, accounts, err := hc.Wallet.AccountsList(dbWallet, math.MaxInt)
+	accounts, err := hc.Wallet.AccountsList(dbWallet, math.MaxInt)
 	if err != nil {
 		ErrInternalServerError(w, r, err.Error())
 		return
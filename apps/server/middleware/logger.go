@@ -53,6 +53,11 @@ func Logger(next http.Handler) http.Handler {
 func RequestLogger(f LogFormatter) func(next http.Handler) http.Handler {
 	return func(next http.Handler) http.Handler {
 		fn := func(w http.ResponseWriter, r *http.Request) {
+			// Don't build the entry at all if it won't be written
+			if !log.InfoEnabled() {
+				next.ServeHTTP(w, r)
+				return
+			}
 			entry := f.NewLogEntry(r)
 			ww := NewWrapResponseWriter(w, r.ProtoMajor)
 
@@ -158,7 +163,8 @@ func (l *defaultLogEntry) Write(status, bytes int, header http.Header, elapsed t
 		cW(l.buf, l.useColor, nRed, "%s", elapsed)
 	}
 
-	log.Infof(l.buf.String())
+	// The line is already formatted, don't run it through Sprintf a second time
+	log.Info(l.buf.String())
 }
 
 func init() {
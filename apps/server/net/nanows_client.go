@@ -21,10 +21,11 @@ type wsSubscribe struct {
 	Options map[string][]string `json:"options"`
 }
 
+// Message is kept raw so it's only decoded once we know it's a confirmation
 type ConfirmationResponse struct {
-	Topic   string                 `json:"topic"`
-	Time    string                 `json:"time"`
-	Message map[string]interface{} `json:"message"`
+	Topic   string          `json:"topic"`
+	Time    string          `json:"time"`
+	Message json.RawMessage `json:"message"`
 }
 
 type WSCallbackBlock struct {
@@ -119,12 +120,7 @@ func StartNanoWSClient(wsUrl string, callbackChan *chan *WSCallbackMsg) {
 			// Trigger callback
 			if confMessage.Topic == "confirmation" {
 				var deserialized WSCallbackMsg
-				serialized, err := json.Marshal(confMessage.Message)
-				if err != nil {
-					log.Infof("Error: Marshal ws %v", err)
-					continue
-				}
-				if err := json.Unmarshal(serialized, &deserialized); err != nil {
+				if err := json.Unmarshal(confMessage.Message, &deserialized); err != nil {
 					log.Errorf("Error: decoding the callback to WSCallbackMsg %v", err)
 					continue
 				}
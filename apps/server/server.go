@@ -2,10 +2,13 @@ package server
 
 import (
 	"context"
+	"errors"
 	"fmt"
 	"math/big"
 	"net/http"
 	"os"
+	"os/signal"
+	"syscall"
 	"time"
 
 	"github.com/appditto/pippin_nano_wallet/apps/server/controller"
@@ -18,10 +21,17 @@ import (
 	rpc "github.com/appditto/pippin_nano_wallet/libs/rpc"
 	"github.com/appditto/pippin_nano_wallet/libs/utils"
 	"github.com/appditto/pippin_nano_wallet/libs/wallet"
-	"github.com/go-chi/chi/v5"
 )
 
 func StartPippinServer() {
+	// e.g. LOG_LEVEL=warn to drop the per-request and other info logs
+	if level := utils.GetEnv("LOG_LEVEL", ""); level != "" {
+		if err := log.SetLevel(level); err != nil {
+			log.Fatalf("Invalid LOG_LEVEL: %v", err)
+			os.Exit(1)
+		}
+	}
+
 	// Read yaml configuration
 	conf, err := config.ParsePippinConfig()
 	if err != nil {
@@ -51,6 +61,14 @@ func StartPippinServer() {
 		os.Exit(1)
 	}
 
+	// The node RPC and work peer clients share http.DefaultTransport
+	// Its default of 2 idle connections per host forces new TCP/TLS handshakes under concurrent load
+	if transport, ok := http.DefaultTransport.(*http.Transport); ok {
+		transport.MaxIdleConns = 100
+		transport.MaxIdleConnsPerHost = 16
+		transport.IdleConnTimeout = 90 * time.Second
+	}
+
 	// Setup RPC handlers
 	rpcClient := rpc.NewRPCClient(conf.Server.NodeRpcUrl)
 
@@ -73,6 +91,13 @@ func StartPippinServer() {
 		go net.StartNanoWSClient(conf.Server.NodeWsUrl, &callbackChan)
 	}
 
+	// Parsed once here rather than for every callback message
+	receiveMinimum, ok := big.NewInt(0).SetString(conf.Wallet.ReceiveMinimum, 10)
+	if !ok {
+		log.Fatalf("Invalid receive_minimum %s", conf.Wallet.ReceiveMinimum)
+		os.Exit(1)
+	}
+
 	// Read channel to automatically receive blocks
 	go func() {
 		for msg := range callbackChan {
@@ -92,10 +117,6 @@ func StartPippinServer() {
 					return
 				}
 				// Compare to receive minimum
-				receiveMinimum, ok := big.NewInt(0).SetString(conf.Wallet.ReceiveMinimum, 10)
-				if !ok {
-					return
-				}
 				if amount.Cmp(receiveMinimum) < 0 {
 					return
 				}
@@ -117,15 +138,51 @@ func StartPippinServer() {
 		}
 	}()
 
-	// Create app
-	app := chi.NewRouter()
-
 	// Setup controller
 	hc := controller.HttpController{Wallet: &nanoWallet, RpcClient: rpcClient, PowClient: pow}
 
-	// HTTP Routes
-	app.Use(middleware.Logger)
-	app.Post("/", hc.Gateway)
+	// Create app, the only route is POST / so we dispatch to the gateway directly instead of through a router
+	app := middleware.Logger(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		if r.URL.Path != "/" {
+			http.NotFound(w, r)
+			return
+		}
+		if r.Method != http.MethodPost {
+			w.WriteHeader(http.StatusMethodNotAllowed)
+			return
+		}
+		hc.Gateway(w, r)
+	}))
+
+	srv := &http.Server{
+		Addr:    fmt.Sprintf("%s:%d", conf.Server.Host, conf.Server.Port),
+		Handler: app,
+	}
+
+	// Shut down gracefully on SIGINT/SIGTERM, letting in-flight requests finish so the deferred cleanup actually runs
+	sigCtx, stop := signal.NotifyContext(ctx, os.Interrupt, syscall.SIGTERM)
+	defer stop()
+	shutdownComplete := make(chan struct{})
+	go func() {
+		<-sigCtx.Done()
+		// Restore default signal handling, a second Ctrl-C exits immediately instead of waiting out the shutdown
+		stop()
+		log.Info("👋 Shutting down...")
+		shutdownCtx, cancel := context.WithTimeout(context.Background(), time.Second*10)
+		defer cancel()
+		if err := srv.Shutdown(shutdownCtx); err != nil {
+			log.Errorf("Error shutting down server: %v", err)
+		}
+		close(shutdownComplete)
+	}()
+
+	if err := srv.ListenAndServe(); err != nil && !errors.Is(err, http.ErrServerClosed) {
+		log.Fatalf("Failed to start server: %v", err)
+		os.Exit(1)
+	}
+	<-shutdownComplete
 
-	http.ListenAndServe(fmt.Sprintf("%s:%d", conf.Server.Host, conf.Server.Port), app)
+	if err := database.GetRedisDB().Client.Close(); err != nil {
+		log.Errorf("Error closing redis client: %v", err)
+	}
 }
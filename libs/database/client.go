@@ -2,6 +2,7 @@ package database
 
 import (
 	"database/sql"
+	"time"
 
 	entsql "entgo.io/ent/dialect/sql"
 	"github.com/appditto/pippin_nano_wallet/libs/database/ent"
@@ -9,12 +10,28 @@ import (
 	_ "modernc.org/sqlite"
 )
 
+// database/sql only keeps 2 idle connections by default
+// Under concurrent requests that means a new TCP + auth handshake with the database for most queries
+const maxIdleConns = 16
+const connMaxIdleTime = 5 * time.Minute
+
 func NewEntClient(connInfo SqlDBConn) (*ent.Client, error) {
 	db, err := sql.Open(connInfo.Driver(), connInfo.DSN())
 	if err != nil {
 		return nil, err
 	}
+	configurePool(db, connInfo)
 
 	drv := entsql.OpenDB(connInfo.Dialect(), db)
 	return ent.NewClient(ent.Driver(drv)), nil
 }
+
+// Keeps enough idle connections around for network databases
+// SQLite is left on the defaults, an in-memory database is dropped once its last connection closes
+func configurePool(db *sql.DB, connInfo SqlDBConn) {
+	switch connInfo.(type) {
+	case *PostgresConn, *MysqlConn:
+		db.SetMaxIdleConns(maxIdleConns)
+		db.SetConnMaxIdleTime(connMaxIdleTime)
+	}
+}
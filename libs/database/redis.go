@@ -120,6 +120,12 @@ func (r *redisManager) Hset(key string, field string, values interface{}) error
 	return err
 }
 
+// hset - Redis HSET with multiple fields, in a single round trip
+func (r *redisManager) HsetMulti(key string, values map[string]interface{}) error {
+	err := r.Client.HSet(ctx, key, values).Err()
+	return err
+}
+
 // hdel - Redis HDEL
 func (r *redisManager) Hdel(key string, field string) error {
 	err := r.Client.HDel(ctx, key, field).Err()
@@ -64,6 +64,18 @@ func TestHset(t *testing.T) {
 	assert.Equal(t, nil, err)
 }
 
+func TestHsetMulti(t *testing.T) {
+	// Mock redis client
+	os.Setenv("MOCK_REDIS", "true")
+	defer os.Unsetenv("MOCK_REDIS")
+	h := "multihashes"
+	err := GetRedisDB().HsetMulti(h, map[string]interface{}{"k1": "v1", "k2": "v2"})
+	assert.Equal(t, nil, err)
+	val, err := GetRedisDB().Hgetall(h)
+	assert.Equal(t, nil, err)
+	assert.Equal(t, map[string]string{"k1": "v1", "k2": "v2"}, val)
+}
+
 func TestHget(t *testing.T) {
 	// Mock redis client
 	os.Setenv("MOCK_REDIS", "true")
@@ -3,6 +3,7 @@ package log
 import (
 	"fmt"
 	"os"
+	"sync"
 
 	"github.com/charmbracelet/log"
 )
@@ -12,44 +13,64 @@ var warnLogger *log.Logger
 var errorLogger *log.Logger
 var fatalLogger *log.Logger
 
+// Loggers are shared by every goroutine, so build them exactly once
+var loggersOnce sync.Once
+
+func newLogger(prefix string) *log.Logger {
+	logger := log.New(os.Stderr)
+	logger.SetPrefix(prefix)
+	logger.SetReportTimestamp(true)
+	return logger
+}
+
 func getLogger(level log.Level) *log.Logger {
-	if level == log.FatalLevel {
-		if fatalLogger == nil {
-			fatalLogger = log.New(os.Stderr)
-			fatalLogger.SetPrefix("☠️🟥☠️")
-			fatalLogger.SetReportTimestamp(true)
-		}
+	loggersOnce.Do(func() {
+		fatalLogger = newLogger("☠️🟥☠️")
+		errorLogger = newLogger("🟥")
+		warnLogger = newLogger("🟨")
+		infoLogger = newLogger("🟦")
+	})
+	switch level {
+	case log.FatalLevel:
 		return fatalLogger
-	}
-	if level == log.ErrorLevel {
-		if errorLogger == nil {
-			errorLogger = log.New(os.Stderr)
-			errorLogger.SetPrefix("🟥")
-			errorLogger.SetReportTimestamp(true)
-		}
+	case log.ErrorLevel:
 		return errorLogger
-	}
-	if level == log.WarnLevel {
-		if warnLogger == nil {
-			warnLogger = log.New(os.Stderr)
-			warnLogger.SetPrefix("🟨")
-			warnLogger.SetReportTimestamp(true)
-		}
+	case log.WarnLevel:
 		return warnLogger
 	}
-	if infoLogger == nil {
-		infoLogger = log.New(os.Stderr)
-		infoLogger.SetPrefix("🟦")
-		infoLogger.SetReportTimestamp(true)
-	}
 	return infoLogger
 }
 
+// Sets the minimum level for every logger, e.g. "warn" to drop info messages
+func SetLevel(level string) error {
+	lvl, err := log.ParseLevel(level)
+	if err != nil {
+		return err
+	}
+	for _, l := range []log.Level{log.FatalLevel, log.ErrorLevel, log.WarnLevel, log.InfoLevel} {
+		getLogger(l).SetLevel(lvl)
+	}
+	return nil
+}
+
+// Whether info messages are written, callers can skip building them otherwise
+func InfoEnabled() bool {
+	return enabled(log.InfoLevel)
+}
+
+func enabled(level log.Level) bool {
+	return getLogger(level).GetLevel() <= level
+}
+
 func Info(msg interface{}, keyvals ...interface{}) {
 	getLogger(log.InfoLevel).Info(msg, keyvals...)
 }
 
+// The *f variants only format the message if it will be written
 func Infof(format string, args ...any) {
+	if !enabled(log.InfoLevel) {
+		return
+	}
 	getLogger(log.InfoLevel).Info(fmt.Sprintf(format, args...))
 }
 
@@ -58,6 +79,9 @@ func Error(msg interface{}, keyvals ...interface{}) {
 }
 
 func Errorf(format string, args ...any) {
+	if !enabled(log.ErrorLevel) {
+		return
+	}
 	getLogger(log.ErrorLevel).Error(fmt.Sprintf(format, args...))
 }
 
@@ -66,6 +90,9 @@ func Warn(msg interface{}, keyvals ...interface{}) {
 }
 
 func Warnf(format string, args ...any) {
+	if !enabled(log.WarnLevel) {
+		return
+	}
 	getLogger(log.WarnLevel).Warn(fmt.Sprintf(format, args...))
 }
 
@@ -39,28 +39,28 @@ func MultiplierFromDifficulty(difficulty uint64) int {
 
 func IsWorkValid(previous string, difficultyMultiplier int, w string) bool {
 	difficult := DifficultyFromMultiplier(difficultyMultiplier)
-	previousEnc, err := hex.DecodeString(previous)
-	if err != nil {
+	// Work is 8 bytes and the hash it's computed for is 32, decode straight into arrays of that size
+	if len(previous) != 64 || len(w) != 16 {
 		return false
 	}
-	wEnc, err := hex.DecodeString(w)
-	if err != nil {
+	var input [40]byte
+	if _, err := hex.Decode(input[8:], []byte(previous)); err != nil {
+		return false
+	}
+	if _, err := hex.Decode(input[:8], []byte(w)); err != nil {
 		return false
 	}
+	reverse(input[:8])
 
 	hash, err := blake2b.New(8, nil)
 	if err != nil {
 		return false
 	}
+	// blake2b(reversed work || previous)
+	hash.Write(input[:])
 
-	n := make([]byte, 8)
-	copy(n, wEnc[:])
-
-	reverse(n)
-	hash.Write(n)
-	hash.Write(previousEnc[:])
-
-	return binary.LittleEndian.Uint64(hash.Sum(nil)) >= difficult
+	var sum [8]byte
+	return binary.LittleEndian.Uint64(hash.Sum(sum[:0])) >= difficult
 }
 
 func reverse(v []byte) {
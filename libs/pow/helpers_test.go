@@ -43,6 +43,10 @@ func TestIsWorkValid(t *testing.T) {
 	hash = "03DDDFF29D3FF3DC41B5374A10A70B49F7AA41E42461511D6A64F346F9C8421E"
 	workResult = "00000000002d7708"
 	assert.False(t, IsWorkValid(hash, 1, workResult))
+
+	// Wrong lengths
+	assert.False(t, IsWorkValid("3F93C5CD2E314FA16702189041E68E68C07B27961BF37F0B7705145BEFBA3A", 1, "205452237a9b01f4"))
+	assert.False(t, IsWorkValid("3F93C5CD2E314FA16702189041E68E68C07B27961BF37F0B7705145BEFBA3AA3", 1, "205452237a9b01"))
 }
 
 func TestReverse(t *testing.T) {
@@ -12,11 +12,21 @@ import (
 	"github.com/appditto/pippin_nano_wallet/libs/pow/models"
 )
 
+// Shared across requests so connections to work peers are kept alive and reused
+// Uses http.DefaultTransport, which holds the connection pool
+var httpClient = &http.Client{}
+
 // Base request
 func MakeRequest(ctx context.Context, url string, request interface{}, authorization string) ([]byte, error) {
 	requestBody, _ := json.Marshal(request)
+	return MakeRawRequest(ctx, url, requestBody, authorization)
+}
+
+// Posts an already encoded body, so the same payload can be sent to many peers
+func MakeRawRequest(ctx context.Context, url string, requestBody []byte, authorization string) ([]byte, error) {
 	// HTTP post
-	httpRequest, err := http.NewRequest(http.MethodPost, url, bytes.NewBuffer(requestBody))
+	// Bind the request to ctx so peers that lose the race are aborted when the caller cancels
+	httpRequest, err := http.NewRequestWithContext(ctx, http.MethodPost, url, bytes.NewReader(requestBody))
 	if err != nil {
 		log.Errorf("Error building request %s", err)
 		return nil, err
@@ -25,11 +35,12 @@ func MakeRequest(ctx context.Context, url string, request interface{}, authoriza
 	if authorization != "" {
 		httpRequest.Header.Add("Authorization", authorization)
 	}
-	httpRequest.WithContext(ctx)
-	client := &http.Client{}
-	resp, err := client.Do(httpRequest)
+	resp, err := httpClient.Do(httpRequest)
 	if err != nil {
-		log.Errorf("Error making RPC request %s", err)
+		// A cancelled context is expected once another peer has returned work
+		if ctx.Err() == nil {
+			log.Errorf("Error making RPC request %s", err)
+		}
 		return nil, err
 	}
 	defer resp.Body.Close()
@@ -42,17 +53,40 @@ func MakeRequest(ctx context.Context, url string, request interface{}, authoriza
 	return body, nil
 }
 
-func MakeWorkGenerateRequest(ctx context.Context, url string, hash string, difficulty string) (*models.WorkGenerateResponse, error) {
-	request := models.WorkGenerateRequest{
+// Encodes a work_generate request once so it can be shared by every work peer
+func NewWorkGenerateRequestBody(hash string, difficulty string) ([]byte, error) {
+	return json.Marshal(models.WorkGenerateRequest{
 		WorkBaseRequest: models.WorkBaseRequest{
 			Action: "work_generate",
 			Hash:   hash,
 		},
 		Difficulty: difficulty,
+	})
+}
+
+// Encodes a work_cancel request once so it can be shared by every work peer
+func NewWorkCancelRequestBody(hash string) ([]byte, error) {
+	return json.Marshal(models.WorkBaseRequest{
+		Action: "work_cancel",
+		Hash:   hash,
+	})
+}
+
+func MakeWorkGenerateRequest(ctx context.Context, url string, hash string, difficulty string) (*models.WorkGenerateResponse, error) {
+	requestBody, err := NewWorkGenerateRequestBody(hash, difficulty)
+	if err != nil {
+		return nil, err
 	}
-	response, err := MakeRequest(ctx, url, request, "")
+	return MakeWorkGenerateRequestWithBody(ctx, url, requestBody)
+}
+
+// Sends a body built by NewWorkGenerateRequestBody
+func MakeWorkGenerateRequestWithBody(ctx context.Context, url string, requestBody []byte) (*models.WorkGenerateResponse, error) {
+	response, err := MakeRawRequest(ctx, url, requestBody, "")
 	if err != nil {
-		log.Errorf("Error making request %s", err)
+		if ctx.Err() == nil {
+			log.Errorf("Error making request %s", err)
+		}
 		return nil, err
 	}
 	var resp models.WorkGenerateResponse
@@ -71,11 +105,16 @@ func MakeWorkGenerateRequest(ctx context.Context, url string, hash string, diffi
 
 // We don't care about the response for work cancel
 func MakeWorkCancelRequest(ctx context.Context, url string, hash string) error {
-	request := models.WorkBaseRequest{
-		Action: "work_cancel",
-		Hash:   hash,
+	requestBody, err := NewWorkCancelRequestBody(hash)
+	if err != nil {
+		return err
 	}
-	_, err := MakeRequest(ctx, url, request, "")
+	return MakeWorkCancelRequestWithBody(ctx, url, requestBody)
+}
+
+// Sends a body built by NewWorkCancelRequestBody
+func MakeWorkCancelRequestWithBody(ctx context.Context, url string, requestBody []byte) error {
+	_, err := MakeRawRequest(ctx, url, requestBody, "")
 	if err != nil {
 		log.Errorf("Error making request %s", err)
 		return err
@@ -94,7 +133,9 @@ func MakeBoompowWorkGenerateRequest(ctx context.Context, url string, bpowKey str
 	}
 	response, err := MakeRequest(ctx, url, request, bpowKey)
 	if err != nil {
-		log.Errorf("Error making request %s", err)
+		if ctx.Err() == nil {
+			log.Errorf("Error making request %s", err)
+		}
 		return "", err
 	}
 	var resp models.BoompowResponse
@@ -68,6 +68,32 @@ func TestWorkCancel(t *testing.T) {
 	assert.Nil(t, err)
 }
 
+func TestWorkGenerateSharedBody(t *testing.T) {
+	httpmock.Activate()
+	defer httpmock.DeactivateAndReset()
+
+	httpmock.RegisterResponder("POST", "https://workurl.com",
+		func(req *http.Request) (*http.Response, error) {
+			resp, err := httpmock.NewJsonResponse(200, map[string]interface{}{
+				"work": "abcd1234",
+			})
+			return resp, err
+		},
+	)
+
+	body, err := NewWorkGenerateRequestBody("3F93C5CD2E314FA16702189041E68E68C07B27961BF37F0B7705145BEFBA3AA3", "ffffffffffff")
+	assert.Nil(t, err)
+	assert.Equal(t, `{"action":"work_generate","hash":"3F93C5CD2E314FA16702189041E68E68C07B27961BF37F0B7705145BEFBA3AA3","difficulty":"ffffffffffff"}`, string(body))
+
+	// The same body can be sent more than once
+	for i := 0; i < 2; i++ {
+		resp, err := MakeWorkGenerateRequestWithBody(context.TODO(), "https://workurl.com", body)
+		assert.Nil(t, err)
+		assert.Equal(t, "abcd1234", resp.Work)
+	}
+	assert.Equal(t, 2, httpmock.GetTotalCallCount())
+}
+
 func TestBoompowWorkGenerate(t *testing.T) {
 	httpmock.Activate()
 	defer httpmock.DeactivateAndReset()
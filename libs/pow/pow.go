@@ -4,13 +4,11 @@ import (
 	"context"
 	"encoding/hex"
 	"errors"
-	"fmt"
 	"sync"
 	"time"
 
 	"github.com/appditto/pippin_nano_wallet/libs/log"
 	"github.com/appditto/pippin_nano_wallet/libs/pow/net"
-	"github.com/appditto/pippin_nano_wallet/libs/utils"
 	"github.com/bbedward/nanopow"
 )
 
@@ -42,7 +40,8 @@ func NewPippinPow(workPeers []string, bpowKey string, bpowUrl string, workTimeou
 		bpowUrl = "https://boompow.banano.cc/graphql"
 	}
 	return &PippinPow{
-		WorkPeers: workPeers,
+		// Copy so we don't alias the caller's (config) slice
+		WorkPeers: append([]string(nil), workPeers...),
 		// If peers are failing we will generate local pow no matter what
 		workPeersFailing: false,
 		bpowUrl:          bpowUrl,
@@ -52,8 +51,9 @@ func NewPippinPow(workPeers []string, bpowKey string, bpowUrl string, workTimeou
 }
 
 // Makes a request to configured array of work peers
-func (p *PippinPow) workGenerateAPIRequest(ctx context.Context, url string, hash string, difficultyMultiplier int, difficulty string, validate bool, out chan *string) {
-	resp, err := net.MakeWorkGenerateRequest(ctx, url, hash, difficulty)
+// requestBody is the encoded work_generate request, shared by every peer
+func (p *PippinPow) workGenerateAPIRequest(ctx context.Context, url string, hash string, difficultyMultiplier int, requestBody []byte, validate bool, out chan *string) {
+	resp, err := net.MakeWorkGenerateRequestWithBody(ctx, url, requestBody)
 	if err == nil && resp.Work != "" {
 		// Validate work
 		if IsWorkValid(hash, difficultyMultiplier, resp.Work) || !validate {
@@ -81,13 +81,10 @@ func (p *PippinPow) workGenerateBpowRequest(ctx context.Context, hash string, di
 
 // Use GPU or CPU to generate work
 func (p *PippinPow) generateWorkLocally(hash string, difficultyMultiplier int) (string, error) {
-	// Generate work locally
-	if !utils.Validate64HexHash(hash) {
-		return "", errors.New("invalid hash")
-	}
+	// Generate work locally, decoding the hash also validates it
 	decoded, err := hex.DecodeString(hash)
-	if err != nil {
-		return "", err
+	if err != nil || len(decoded) != 32 {
+		return "", errors.New("invalid hash")
 	}
 	res, err := nanopow.GenerateWork(decoded, DifficultyFromMultiplier(difficultyMultiplier))
 
@@ -110,9 +107,31 @@ func (p *PippinPow) workGenerateLocal(ctx context.Context, hash string, difficul
 	}
 }
 
-// Makes a work cancel request
-func WorkCancelAPIRequest(url string, hash string) {
-	net.MakeWorkCancelRequest(context.Background(), url, hash)
+// Sends work cancel to every peer, encoding the request only once
+func (p *PippinPow) cancelWorkPeers(hash string) {
+	if len(p.WorkPeers) < 1 {
+		return
+	}
+	requestBody, err := net.NewWorkCancelRequestBody(hash)
+	if err != nil {
+		return
+	}
+	for _, peer := range p.WorkPeers {
+		go net.MakeWorkCancelRequestWithBody(context.Background(), peer, requestBody)
+	}
+}
+
+// Buffered with room for every writer, so none of them can block on a result nobody reads
+// One per work peer, plus BoomPoW and local PoW when they run
+func (p *PippinPow) newResultChan(bpowKey string, runningLocally bool) chan *string {
+	chanSize := len(p.WorkPeers)
+	if p.bpowUrl != "" && (bpowKey != "" || p.bpowKey != "") {
+		chanSize++
+	}
+	if runningLocally {
+		chanSize++
+	}
+	return make(chan *string, chanSize)
 }
 
 // The main entry point for Pippin WorkGenerate
@@ -131,24 +150,27 @@ func (p *PippinPow) WorkGenerateMeta(hash string, difficultyMultiplier int, vali
 	ctx, cancel := context.WithCancel(ctx)
 	defer cancel()
 
-	chanSize := len(p.WorkPeers)
-	if p.bpowUrl != "" && (bpowKey != "" || p.bpowKey != "") {
-		chanSize++
-	}
-	resultChan := make(chan *string, chanSize)
-	defer close(resultChan)
+	runningLocally := (len(p.WorkPeers) < 1 && p.bpowKey == "" && bpowKey == "") || p.WorkPeersFailing()
+
+	// The channel is never closed, writers that finish late just leave their result in the buffer
+	resultChan := p.newResultChan(bpowKey, runningLocally)
 
 	difficultyUint := DifficultyFromMultiplier(difficultyMultiplier)
 	difficultyStr := DifficultyToString(difficultyUint)
-	runningLocally := false
 
-	if (len(p.WorkPeers) < 1 && p.bpowKey == "" && bpowKey == "") || p.WorkPeersFailing() {
+	if runningLocally {
 		// Local pow
-		runningLocally = true
 		go p.workGenerateLocal(ctx, hash, difficultyMultiplier, validate, resultChan)
 	}
-	for _, peer := range p.WorkPeers {
-		go p.workGenerateAPIRequest(ctx, peer, hash, difficultyMultiplier, difficultyStr, validate, resultChan)
+	if len(p.WorkPeers) > 0 {
+		// Same payload for every peer, encode it once
+		requestBody, err := net.NewWorkGenerateRequestBody(hash, difficultyStr)
+		if err != nil {
+			return "", err
+		}
+		for _, peer := range p.WorkPeers {
+			go p.workGenerateAPIRequest(ctx, peer, hash, difficultyMultiplier, requestBody, validate, resultChan)
+		}
 	}
 	if p.bpowUrl != "" {
 		key := bpowKey
@@ -160,18 +182,21 @@ func (p *PippinPow) WorkGenerateMeta(hash string, difficultyMultiplier int, vali
 		}
 	}
 
+	// time.After would keep its timer alive for the full timeout even after work is returned
+	timer := time.NewTimer(p.timeout)
+	defer timer.Stop()
+
 	select {
 	case result := <-resultChan:
+		// The deferred cancel() aborts the work_generate requests that lost the race
 		// Send work cancel
-		for _, peer := range p.WorkPeers {
-			go WorkCancelAPIRequest(peer, hash)
-		}
+		p.cancelWorkPeers(hash)
 		return *result, nil
-	case <-time.After(p.timeout):
+	case <-timer.C:
+		// Abort the in-flight work_generate requests before falling back to local work
+		cancel()
 		// Send work cancel
-		for _, peer := range p.WorkPeers {
-			go WorkCancelAPIRequest(peer, hash)
-		}
+		p.cancelWorkPeers(hash)
 		// See if our peers are failing
 		// Generate local pow if it didnt run locally
 		if !runningLocally {
@@ -185,17 +210,13 @@ func (p *PippinPow) WorkGenerateMeta(hash string, difficultyMultiplier int, vali
 	}
 }
 
-// Recovers from writing to close channel
-func WriteChannelSafe(out chan *string, msg string) (err error) {
-	defer func() {
-		// recover from panic caused by writing to a closed channel
-		if r := recover(); r != nil {
-			err = fmt.Errorf("%v", r)
-			return
-		}
-	}()
-
-	out <- &msg // write on possibly closed channel
-
-	return err
+// Delivers a result without blocking
+// Returns an error if the channel is already full, i.e. a result was already delivered
+func WriteChannelSafe(out chan *string, msg string) error {
+	select {
+	case out <- &msg:
+		return nil
+	default:
+		return errors.New("result channel is full")
+	}
 }
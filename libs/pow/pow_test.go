@@ -3,6 +3,7 @@ package pow
 import (
 	"net/http"
 	"os"
+	"runtime"
 	"testing"
 	"time"
 
@@ -194,3 +195,50 @@ func TestWorkGenerateMeta(t *testing.T) {
 	assert.Nil(t, err)
 	assert.Len(t, result, 16)
 }
+
+// With peers marked failing local PoW runs next to the peers, every one of them must be able to deliver
+func TestWorkGenerateMetaPeersFailing(t *testing.T) {
+	httpmock.Activate()
+	defer httpmock.DeactivateAndReset()
+
+	httpmock.RegisterResponder("POST", "https://workerurl1.com",
+		func(req *http.Request) (*http.Response, error) {
+			resp, err := httpmock.NewJsonResponse(200, map[string]interface{}{
+				"work": "1111",
+			})
+			return resp, err
+		},
+	)
+	httpmock.RegisterResponder("POST", "https://workerurl2.com",
+		func(req *http.Request) (*http.Response, error) {
+			resp, err := httpmock.NewJsonResponse(200, map[string]interface{}{
+				"work": "2222",
+			})
+			return resp, err
+		},
+	)
+
+	ppow := NewPippinPow([]string{"https://workerurl1.com", "https://workerurl2.com"}, "", "", 30)
+	ppow.SetWorkPeersFailing(true)
+
+	// A slot for each peer and for local PoW
+	assert.Equal(t, 3, cap(ppow.newResultChan("", true)))
+
+	baseline := runtime.NumGoroutine()
+	result, err := ppow.WorkGenerateMeta("09263b65752d05ce4df5aeed849ffc2be5bf47026abb4fa5879359ae571ba9c8", 1, false, false, "")
+	assert.Nil(t, err)
+	assert.NotEmpty(t, result)
+
+	// Local PoW and the losing peer finish after we returned, none of them may be left blocked
+	assert.Eventually(t, func() bool {
+		return runtime.NumGoroutine() <= baseline
+	}, 30*time.Second, 50*time.Millisecond)
+}
+
+func TestWriteChannelSafe(t *testing.T) {
+	out := make(chan *string, 1)
+	assert.Nil(t, WriteChannelSafe(out, "first"))
+	// Full channel doesn't block the writer
+	assert.NotNil(t, WriteChannelSafe(out, "second"))
+	assert.Equal(t, "first", *<-out)
+}
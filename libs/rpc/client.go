@@ -38,8 +38,14 @@ func (client *RPCClient) MakeRequest(request interface{}) ([]byte, error) {
 		log.Errorf("Error marshalling request %s", err)
 		return nil, err
 	}
+	return client.MakeRawRequest(requestBody)
+}
+
+// Posts an already encoded request and returns the node's response as-is
+// Used to proxy requests without decoding and re-encoding them
+func (client *RPCClient) MakeRawRequest(requestBody []byte) ([]byte, error) {
 	// HTTP post
-	resp, err := client.httpClient.Post(client.Url, "application/json", bytes.NewBuffer(requestBody))
+	resp, err := client.httpClient.Post(client.Url, "application/json", bytes.NewReader(requestBody))
 	if err != nil {
 		log.Errorf("Error making RPC request %s", err)
 		return nil, err
@@ -54,6 +60,25 @@ func (client *RPCClient) MakeRequest(request interface{}) ([]byte, error) {
 	return body, nil
 }
 
+// Checks a node response for an "error" key without decoding the rest of it into a map
+// Typed responses are then unmarshalled directly, rather than going through map[string]interface{} + mapstructure
+func responseError(response []byte) error {
+	var resp struct {
+		Error interface{} `json:"error"`
+	}
+	if err := json.Unmarshal(response, &resp); err != nil {
+		log.Errorf("Error unmarshalling response %s", err)
+		return err
+	}
+	if resp.Error == nil {
+		return nil
+	}
+	if errStr, ok := resp.Error.(string); ok {
+		return errors.New(errStr)
+	}
+	return errors.New("Unknown error")
+}
+
 func (client *RPCClient) MakeAccountsBalancesRequest(accounts []string) (*responses.AccountsBalancesResponse, error) {
 	request := requests.AccountsRequest{
 		BaseRequest: requests.BaseRequest{
@@ -66,22 +91,11 @@ func (client *RPCClient) MakeAccountsBalancesRequest(accounts []string) (*respon
 		log.Errorf("Error making request %s", err)
 		return nil, err
 	}
-	var resp map[string]interface{}
-	err = json.Unmarshal(response, &resp)
-	if err != nil {
-		log.Errorf("Error unmarshalling response %s", err)
+	if err := responseError(response); err != nil {
 		return nil, err
 	}
-	// See if contains an error
-	if val, ok := resp["error"]; ok {
-		errStr, ok := val.(string)
-		if ok {
-			return nil, errors.New(errStr)
-		}
-		return nil, errors.New("Unknown error")
-	}
 	var decoded responses.AccountsBalancesResponse
-	err = mapstructure.Decode(resp, &decoded)
+	err = json.Unmarshal(response, &decoded)
 	if err != nil {
 		log.Errorf("Error decoding response %s", err)
 		return nil, err
@@ -106,22 +120,11 @@ func (client *RPCClient) MakeAccountBalanceRequest(account string) (*responses.A
 		log.Errorf("Error making request %s", err)
 		return nil, err
 	}
-	var resp map[string]interface{}
-	err = json.Unmarshal(response, &resp)
-	if err != nil {
-		log.Errorf("Error unmarshalling response %s", err)
+	if err := responseError(response); err != nil {
 		return nil, err
 	}
-	// See if contains an error
-	if val, ok := resp["error"]; ok {
-		errStr, ok := val.(string)
-		if ok {
-			return nil, errors.New(errStr)
-		}
-		return nil, errors.New("Unknown error")
-	}
 	var decoded responses.AccountBalanceItem
-	err = mapstructure.Decode(resp, &decoded)
+	err = json.Unmarshal(response, &decoded)
 	if err != nil {
 		log.Errorf("Error decoding response %s", err)
 		return nil, err
@@ -146,22 +149,11 @@ func (client *RPCClient) MakeAccountsFrontiersRequest(accounts []string) (*respo
 		log.Errorf("Error making request %s", err)
 		return nil, err
 	}
-	var resp map[string]interface{}
-	err = json.Unmarshal(response, &resp)
-	if err != nil {
-		log.Errorf("Error unmarshalling response %s", err)
+	if err := responseError(response); err != nil {
 		return nil, err
 	}
-	// See if contains an error
-	if val, ok := resp["error"]; ok {
-		errStr, ok := val.(string)
-		if ok {
-			return nil, errors.New(errStr)
-		}
-		return nil, errors.New("Unknown error")
-	}
 	var decoded responses.AccountsFrontiersResponse
-	err = mapstructure.Decode(resp, &decoded)
+	err = json.Unmarshal(response, &decoded)
 	if err != nil {
 		log.Errorf("Error decoding response %s", err)
 		return nil, err
@@ -239,22 +231,11 @@ func (client *RPCClient) MakeBlockInfoRequest(hash string) (*responses.BlockInfo
 		log.Errorf("Error making request %s", err)
 		return nil, err
 	}
-	var resp map[string]interface{}
-	err = json.Unmarshal(response, &resp)
-	if err != nil {
-		log.Errorf("Error unmarshalling response %s", err)
+	if err := responseError(response); err != nil {
 		return nil, err
 	}
-	// See if contains an error
-	if val, ok := resp["error"]; ok {
-		errStr, ok := val.(string)
-		if ok {
-			return nil, errors.New(errStr)
-		}
-		return nil, errors.New("Unknown error")
-	}
 	var decoded responses.BlockInfoResponse
-	err = mapstructure.Decode(resp, &decoded)
+	err = json.Unmarshal(response, &decoded)
 	if err != nil {
 		log.Errorf("Error decoding response %s", err)
 		return nil, err
@@ -315,25 +296,14 @@ func (client *RPCClient) MakeAccountInfoRequest(account string) (*responses.Acco
 		log.Errorf("Error making request %s", err)
 		return nil, err
 	}
-	var resp map[string]interface{}
-	err = json.Unmarshal(response, &resp)
-	if err != nil {
-		log.Errorf("Error unmarshalling response %s", err)
-		return nil, err
-	}
-	// See if contains an error
-	if val, ok := resp["error"]; ok {
-		errStr, ok := val.(string)
-		if ok {
-			if strings.ToLower(errStr) == "account not found" {
-				return nil, ErrAccountNotFound
-			}
-			return nil, errors.New(errStr)
+	if err := responseError(response); err != nil {
+		if strings.ToLower(err.Error()) == "account not found" {
+			return nil, ErrAccountNotFound
 		}
-		return nil, errors.New("Unknown error")
+		return nil, err
 	}
 	var decoded responses.AccountInfoResponse
-	err = mapstructure.Decode(resp, &decoded)
+	err = json.Unmarshal(response, &decoded)
 	if err != nil {
 		log.Errorf("Error decoding response %s", err)
 		return nil, err
@@ -294,3 +294,17 @@ func TestMakeReceivableRequest(t *testing.T) {
 	assert.Nil(t, err)
 	assert.Len(t, resp.Blocks, 0)
 }
+
+func TestResponseError(t *testing.T) {
+	assert.Nil(t, responseError([]byte(mocks.AccountInfoResponseStr)))
+
+	err := responseError([]byte(mocks.ErrorResponseStr))
+	assert.NotNil(t, err)
+	assert.Equal(t, "bad input", err.Error())
+
+	err = responseError([]byte(`{"error": 1}`))
+	assert.NotNil(t, err)
+	assert.Equal(t, "Unknown error", err.Error())
+
+	assert.NotNil(t, responseError([]byte("not json")))
+}
@@ -2,28 +2,21 @@ package utils
 
 import (
 	"errors"
-	"reflect"
 	"strconv"
 )
 
+// A single type switch, rather than reflecting on the value and then asserting it again
 func ToInt(val interface{}) (int, error) {
-	if reflect.TypeOf(val).Kind() == reflect.Float64 {
-		asFloat, ok := val.(float64)
-		if !ok {
+	switch v := val.(type) {
+	case float64:
+		if v != float64(int(v)) {
 			return 0, errors.New("not an int")
 		}
-		if asFloat != float64(int(asFloat)) {
-			return 0, errors.New("not an int")
-		}
-		return int(asFloat), nil
-	}
-	asInt, ok := val.(int)
-	if ok {
-		return asInt, nil
-	}
-	asString, ok := val.(string)
-	if ok {
-		asInt, err := strconv.Atoi(asString)
+		return int(v), nil
+	case int:
+		return v, nil
+	case string:
+		asInt, err := strconv.Atoi(v)
 		if err != nil {
 			return 0, errors.New("not an int")
 		}
@@ -33,20 +26,15 @@ func ToInt(val interface{}) (int, error) {
 }
 
 func ToBool(val interface{}) (bool, error) {
-	if reflect.TypeOf(val).Kind() == reflect.String {
-		asString, ok := val.(string)
-		if ok {
-			asBool, err := strconv.ParseBool(asString)
-			if err != nil {
-				return false, errors.New("not a bool")
-			}
-			return asBool, nil
+	switch v := val.(type) {
+	case string:
+		asBool, err := strconv.ParseBool(v)
+		if err != nil {
+			return false, errors.New("not a bool")
 		}
+		return asBool, nil
+	case bool:
+		return v, nil
 	}
-	asBool, ok := val.(bool)
-	if !ok {
-		return false, errors.New("not a bool")
-	}
-	return asBool, nil
-
+	return false, errors.New("not a bool")
 }
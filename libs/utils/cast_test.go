@@ -33,6 +33,11 @@ func TestToInt(t *testing.T) {
 	asInt, err = ToInt(val)
 	assert.ErrorContains(t, err, "not an int")
 	assert.Equal(t, 0, asInt)
+
+	// nil is an error, not a panic
+	asInt, err = ToInt(nil)
+	assert.ErrorContains(t, err, "not an int")
+	assert.Equal(t, 0, asInt)
 }
 
 func TestToBool(t *testing.T) {
@@ -56,4 +61,7 @@ func TestToBool(t *testing.T) {
 	val = "NotABool"
 	asBool, err = ToBool(val)
 	assert.ErrorContains(t, err, "not a bool")
+
+	asBool, err = ToBool(nil)
+	assert.ErrorContains(t, err, "not a bool")
 }
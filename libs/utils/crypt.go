@@ -6,7 +6,7 @@ import (
 	"crypto/rand"
 	"crypto/sha256"
 	"encoding/hex"
-	"fmt"
+	"errors"
 	"io"
 )
 
@@ -14,30 +14,46 @@ const salt = "61606982"
 
 type AESCrypt struct {
 	SecretKey string
+	// Built once and reused, unlocking a wallet decrypts the seed and every adhoc key with the same crypter
+	aead cipher.AEAD
 }
 
 func NewAesCrypt(key string) *AESCrypt {
 	// Sha256 hash the key
-	h := sha256.New()
-	h.Write([]byte(key))
-	return &AESCrypt{SecretKey: hex.EncodeToString(h.Sum(nil))}
+	sum := sha256.Sum256([]byte(key))
+	a := &AESCrypt{SecretKey: hex.EncodeToString(sum[:])}
+	a.aead, _ = a.newAEAD()
+	return a
 }
 
-func (a *AESCrypt) Encrypt(input string) (string, error) {
-
+// Create the AES-GCM cipher for our key - https://en.wikipedia.org/wiki/Galois/Counter_Mode
+func (a *AESCrypt) newAEAD() (cipher.AEAD, error) {
 	//Since the key is in string, we need to convert decode it to bytes
-	key, _ := hex.DecodeString(a.SecretKey)
-	plaintext := []byte(input)
+	key, err := hex.DecodeString(a.SecretKey)
+	if err != nil {
+		return nil, err
+	}
 
 	//Create a new Cipher Block from the key
 	block, err := aes.NewCipher(key)
 	if err != nil {
-		return "", err
+		return nil, err
 	}
 
-	//Create a new GCM - https://en.wikipedia.org/wiki/Galois/Counter_Mode
 	//https://golang.org/pkg/crypto/cipher/#NewGCM
-	aesGCM, err := cipher.NewGCM(block)
+	return cipher.NewGCM(block)
+}
+
+func (a *AESCrypt) getAEAD() (cipher.AEAD, error) {
+	if a.aead != nil {
+		return a.aead, nil
+	}
+	// Not created through NewAesCrypt
+	return a.newAEAD()
+}
+
+func (a *AESCrypt) Encrypt(input string) (string, error) {
+	aesGCM, err := a.getAEAD()
 	if err != nil {
 		return "", err
 	}
@@ -50,29 +66,23 @@ func (a *AESCrypt) Encrypt(input string) (string, error) {
 
 	//Encrypt the data using aesGCM.Seal
 	//Since we don't want to save the nonce somewhere else in this case, we add it as a prefix to the encrypted data. The first nonce argument in Seal is the prefix.
-	ciphertext := aesGCM.Seal(nonce, nonce, plaintext, nil)
-	return fmt.Sprintf("%x", ciphertext), nil
+	ciphertext := aesGCM.Seal(nonce, nonce, []byte(input), nil)
+	return hex.EncodeToString(ciphertext), nil
 }
 
 func (a *AESCrypt) Decrypt(encryptedString string) (string, error) {
-
-	key, _ := hex.DecodeString(a.SecretKey)
-	enc, _ := hex.DecodeString(encryptedString)
-
-	//Create a new Cipher Block from the key
-	block, err := aes.NewCipher(key)
+	aesGCM, err := a.getAEAD()
 	if err != nil {
 		return "", err
 	}
 
-	//Create a new GCM
-	aesGCM, err := cipher.NewGCM(block)
-	if err != nil {
-		return "", err
-	}
+	enc, _ := hex.DecodeString(encryptedString)
 
 	//Get the nonce size
 	nonceSize := aesGCM.NonceSize()
+	if len(enc) < nonceSize {
+		return "", errors.New("ciphertext too short")
+	}
 
 	//Extract the nonce from the encrypted data
 	nonce, ciphertext := enc[:nonceSize], enc[nonceSize:]
@@ -83,5 +93,5 @@ func (a *AESCrypt) Decrypt(encryptedString string) (string, error) {
 		return "", err
 	}
 
-	return fmt.Sprintf("%s", plaintext), nil
+	return string(plaintext), nil
 }
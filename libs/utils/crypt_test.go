@@ -38,3 +38,18 @@ func TestDecodeMessageNotEqualDifferentKeys(t *testing.T) {
 	assert.NotNil(t, err)
 	assert.Equal(t, "", decryptedTwo)
 }
+
+func TestDecodeMessageTooShort(t *testing.T) {
+	decrypted, err := aesCrypt.Decrypt("abcd")
+	assert.NotNil(t, err)
+	assert.Equal(t, "", decrypted)
+}
+
+func TestDecodeMessageWithoutConstructor(t *testing.T) {
+	// Crypter built without NewAesCrypt still works with the same key
+	crypter := &AESCrypt{SecretKey: aesCrypt.SecretKey}
+	encrypted, _ := aesCrypt.Encrypt("my message")
+	decrypted, err := crypter.Decrypt(encrypted)
+	assert.Nil(t, err)
+	assert.Equal(t, "my message", decrypted)
+}
@@ -3,7 +3,6 @@ package utils
 import (
 	"encoding/base32"
 	"errors"
-	"fmt"
 
 	"github.com/appditto/pippin_nano_wallet/libs/utils/ed25519"
 
@@ -15,6 +14,9 @@ const EncodeNano = "13456789abcdefghijkmnopqrstuwxyz"
 
 var NanoEncoding = base32.NewEncoding(EncodeNano)
 
+// Addresses never contain padding, decoding without it rejects '=' instead of zero-filling the output
+var nanoDecoding = NanoEncoding.WithPadding(base32.NoPadding)
+
 func AddressToPub(account string, banano bool) (public_key []byte, err error) {
 	if len(account) < 64 {
 		return nil, errors.New("Invalid account length")
@@ -37,24 +39,29 @@ func AddressToPub(account string, banano bool) (public_key []byte, err error) {
 		// The nano address string is 260bits which doesn't fall on a
 		// byte boundary. pad with zeros to 280bits.
 		// (zeros are encoded as 1 in nano's 32bit alphabet)
-		key_b32nano := "1111" + address[0:52]
-		input_checksum := address[52:]
+		// Decoded into fixed size buffers so a lookup doesn't allocate per step
+		var key_b32nano [56]byte
+		copy(key_b32nano[:4], "1111")
+		copy(key_b32nano[4:], address[0:52])
 
-		key_bytes, err := NanoEncoding.DecodeString(key_b32nano)
+		var key_bytes [35]byte
+		n, err := nanoDecoding.Decode(key_bytes[:], key_b32nano[:])
 		if err != nil {
 			return nil, err
+		} else if n != len(key_bytes) {
+			return nil, errors.New("Invalid address format")
 		}
-		// strip off upper 24 bits (3 bytes). 20 padding was added by us,
-		// 4 is unused as account is 256 bits.
-		key_bytes = key_bytes[3:]
 
 		// nano checksum is calculated by hashing the key and reversing the bytes
-		valid := NanoEncoding.EncodeToString(GetAddressChecksum(key_bytes)) == input_checksum
-		if valid {
-			return key_bytes, nil
-		} else {
+		// strip off upper 24 bits (3 bytes). 20 padding was added by us,
+		// 4 is unused as account is 256 bits.
+		// Compare against the canonical encoding of our checksum, so only that exact string is accepted
+		var checksum [8]byte
+		NanoEncoding.Encode(checksum[:], GetAddressChecksum(key_bytes[3:]))
+		if string(checksum[:]) != address[52:] {
 			return nil, errors.New("Invalid address checksum")
 		}
+		return key_bytes[3:], nil
 	}
 
 	return nil, errors.New("Invalid address format")
@@ -64,9 +71,12 @@ func PubKeyToAddress(pub ed25519.PublicKey, banano bool) string {
 	// Pubkey is 256bits, base32 must be multiple of 5 bits
 	// to encode properly.
 	// Pad the start with 0's and strip them off after base32 encoding
-	padded := append([]byte{0, 0, 0}, pub...)
-	address := NanoEncoding.EncodeToString(padded)[4:]
-	checksum := NanoEncoding.EncodeToString(GetAddressChecksum(pub))
+	var padded [35]byte
+	copy(padded[3:], pub)
+	var encoded [56]byte
+	NanoEncoding.Encode(encoded[:], padded[:])
+	var checksum [8]byte
+	NanoEncoding.Encode(checksum[:], GetAddressChecksum(pub))
 
 	var prefix string
 	if banano {
@@ -75,7 +85,7 @@ func PubKeyToAddress(pub ed25519.PublicKey, banano bool) string {
 		prefix = "nano_"
 	}
 
-	return fmt.Sprintf("%s%s%s", prefix, address, checksum)
+	return prefix + string(encoded[4:]) + string(checksum[:])
 }
 
 func GetAddressChecksum(pub ed25519.PublicKey) []byte {
@@ -85,12 +95,18 @@ func GetAddressChecksum(pub ed25519.PublicKey) []byte {
 	}
 
 	hash.Write(pub)
-	return Reversed(hash.Sum(nil))
+	sum := hash.Sum(nil)
+	// sum is ours, reverse it in place
+	for i, j := 0, len(sum)-1; i < j; i, j = i+1, j-1 {
+		sum[i], sum[j] = sum[j], sum[i]
+	}
+	return sum
 }
 
 func Reversed(str []byte) (result []byte) {
-	for i := len(str) - 1; i >= 0; i-- {
-		result = append(result, str[i])
+	result = make([]byte, len(str))
+	for i := range str {
+		result[len(str)-1-i] = str[i]
 	}
 	return result
 }
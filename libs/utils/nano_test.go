@@ -28,6 +28,26 @@ func TestAddressToPub(t *testing.T) {
 	pub, err = AddressToPub(address, false)
 	assert.NotNil(t, err)
 	assert.Equal(t, "", hex.EncodeToString(pub))
+	// Checksum outside of the nano alphabet
+	address = "nano_3px37c9f6w361j65yoasrcs6wh3hmmyb6eacpis7dwzp8th4hbb9izgba5l2"
+	pub, err = AddressToPub(address, false)
+	assert.ErrorContains(t, err, "Invalid address checksum")
+	assert.Equal(t, "", hex.EncodeToString(pub))
+
+	// Padded checksum, this key's checksum ends in a zero byte so a zero-filled decode would match it
+	address = "nano_166em7fsch6c8od341z4178hic9deo7bmrriz3ztq784ykux7a4hej769hr1"
+	pub, err = AddressToPub(address, false)
+	assert.Nil(t, err)
+	assert.Equal(t, "108c995b953c8a35561103e2014cf828eb654a99e310f87fab94c2f4b7d2a04f", hex.EncodeToString(pub))
+	address = "nano_166em7fsch6c8od341z4178hic9deo7bmrriz3ztq784ykux7a4hej769hr="
+	pub, err = AddressToPub(address, false)
+	assert.ErrorContains(t, err, "Invalid address checksum")
+	assert.Equal(t, "", hex.EncodeToString(pub))
+	// Padding in the key part
+	address = "nano_166em7fsch6c8od341z4178hic9deo7bmrriz3ztq784ykux7a4h=ej769hr1"
+	pub, err = AddressToPub(address, false)
+	assert.NotNil(t, err)
+	assert.Equal(t, "", hex.EncodeToString(pub))
 
 	// Test banano vs nano modes
 	address = "ban_3px37c9f6w361j65yoasrcs6wh3hmmyb6eacpis7dwzp8th4hbb9izgba51j"
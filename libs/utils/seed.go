@@ -17,33 +17,25 @@ func GenerateSeed(rand io.Reader) (string, error) {
 	if rand == nil {
 		rand = cryptorand.Reader
 	}
-	bytes := make([]byte, 32)
-	if _, err := rand.Read(bytes); err != nil {
+	var seed [32]byte
+	// A single Read may return fewer bytes than asked for
+	if _, err := io.ReadFull(rand, seed[:]); err != nil {
 		return "", err
 	}
-	return hex.EncodeToString(bytes), nil
+	return hex.EncodeToString(seed[:]), nil
 }
 
 // Generate a keypair from a seed at specified index
 func KeypairFromSeed(seed string, index uint32) (ed25519.PublicKey, ed25519.PrivateKey, error) {
-	hash, err := blake2b.New(32, nil)
-	if err != nil {
-		return nil, nil, err
-	}
-
 	seed_data, err := hex.DecodeString(seed)
 	if err != nil {
 		return nil, nil, err
 	}
 
-	bs := make([]byte, 4)
-	binary.BigEndian.PutUint32(bs, index)
-
-	hash.Write(seed_data)
-	hash.Write(bs)
-
-	seed_bytes := hash.Sum(nil)
-	pub, priv, err := ed25519.GenerateKey(bytes.NewReader(seed_bytes))
+	// blake2b-256(seed || index), hashed in one call instead of through a streaming hasher
+	seed_data = binary.BigEndian.AppendUint32(seed_data, index)
+	seed_bytes := blake2b.Sum256(seed_data)
+	pub, priv, err := ed25519.GenerateKey(bytes.NewReader(seed_bytes[:]))
 
 	if err != nil {
 		return nil, nil, err
@@ -1,14 +1,15 @@
 package utils
 
-import "encoding/hex"
-
 func Validate64HexHash(hash string) bool {
 	if len(hash) != 64 {
 		return false
 	}
-	_, err := hex.DecodeString(hash)
-	if err != nil {
-		return false
+	// Check the characters directly, hex.DecodeString would allocate a buffer just to throw it away
+	for i := 0; i < len(hash); i++ {
+		c := hash[i]
+		if !(('0' <= c && c <= '9') || ('a' <= c && c <= 'f') || ('A' <= c && c <= 'F')) {
+			return false
+		}
 	}
 	return true
 }
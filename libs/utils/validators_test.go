@@ -9,9 +9,20 @@ import (
 func TestValidate64HexHash(t *testing.T) {
 	valid := "1A2E95A2DCF03143297572EAEC496F6913D5001D2F28A728B35CB274294D5A14"
 	assert.Equal(t, true, Validate64HexHash(valid))
+	// lowercase is valid too
+	assert.Equal(t, true, Validate64HexHash("1a2e95a2dcf03143297572eaec496f6913d5001d2f28a728b35cb274294d5a14"))
 	// invalid, not hex
 	invalid := "1A2E95A2DCZ03143297572EAEC496F6913D5001D2F28A728B35CB274294D5A14"
 	assert.Equal(t, false, Validate64HexHash(invalid))
 	invalid = "1A2E95A2DCF03143297572EAEC496F6913D5001D2F28A728B35CB274294D5A1"
 	assert.Equal(t, false, Validate64HexHash(invalid))
+	// invalid, each character just outside the hex ranges, the rest of the hash is valid
+	for _, c := range []string{"/", ":", "@", "G", "`", "g"} {
+		invalid = "1A2E95A2DCF03143297572EAEC496F6913D5001D2F28A728B35CB274294D5A1" + c
+		assert.Equal(t, false, Validate64HexHash(invalid), c)
+	}
+	// and the range bounds themselves are valid
+	for _, c := range []string{"0", "9", "A", "F", "a", "f"} {
+		assert.Equal(t, true, Validate64HexHash("1A2E95A2DCF03143297572EAEC496F6913D5001D2F28A728B35CB274294D5A1"+c), c)
+	}
 }
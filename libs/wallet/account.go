@@ -238,39 +238,30 @@ func (w *NanoWallet) AdhocAccountCreate(wallet *ent.Wallet, privKey ed25519.Priv
 	return adhocAcct, nil
 }
 
-// Retrieve list of accounts on a wallet, if not locked
-func (w *NanoWallet) AccountsList(wallet *ent.Wallet, limit int) ([]*ent.Account, []string, error) {
+// Retrieve list of account addresses on a wallet, if not locked
+// Only the address column is selected, we don't hydrate full account entities just to read one field
+func (w *NanoWallet) AccountsList(wallet *ent.Wallet, limit int) ([]string, error) {
 	if wallet == nil {
-		return nil, nil, ErrInvalidWallet
+		return nil, ErrInvalidWallet
 	}
 
 	// Determine if wallet is locked or not
 	_, err := GetDecryptedKeyFromStorage(wallet, "seed")
 	if err != nil {
-		return nil, nil, err
+		return nil, err
 	}
 
-	// Get accounts
-	var accounts []*ent.Account
+	// Get account addresses
+	query := w.DB.Account.Query().Where(account.WalletID(wallet.ID))
 	if limit > 0 {
-		accounts, err = w.DB.Account.Query().Where(account.WalletID(wallet.ID)).Limit(limit).All(w.Ctx)
-		if err != nil {
-			return nil, nil, err
-		}
-	} else {
-		accounts, err = w.DB.Account.Query().Where(account.WalletID(wallet.ID)).All(w.Ctx)
-		if err != nil {
-			return nil, nil, err
-		}
+		query = query.Limit(limit)
 	}
-
-	// Concatenate them together as an array of addresses
-	var addresses []string
-	for _, acct := range accounts {
-		addresses = append(addresses, acct.Address)
+	addresses, err := query.Select(account.FieldAddress).Strings(w.Ctx)
+	if err != nil {
+		return nil, err
 	}
 
-	return accounts, addresses, nil
+	return addresses, nil
 }
 
 func (w *NanoWallet) AccountExists(wallet *ent.Wallet, address string) (bool, error) {
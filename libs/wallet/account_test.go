@@ -229,7 +229,7 @@ func TestAccountsList(t *testing.T) {
 	_, err = MockWallet.AdhocAccountCreate(wallet, priv)
 
 	// List accounts
-	_, accts, err := MockWallet.AccountsList(wallet, 100)
+	accts, err := MockWallet.AccountsList(wallet, 100)
 	assert.Nil(t, err)
 	// We actually have 7 accounts because WalletCreate implicitly creates the first one
 	// So this isn't a mistake
@@ -244,7 +244,7 @@ func TestAccountsList(t *testing.T) {
 	assert.Contains(t, accts, "nano_1bzpyc67m6hzhm8egshbnyseowohs11d7hkcw4ksz8guetsyegkx3r1ns6s4")
 
 	// 0 removes the limit clause
-	_, accts, err = MockWallet.AccountsList(wallet, 0)
+	accts, err = MockWallet.AccountsList(wallet, 0)
 	assert.Nil(t, err)
 	// We actually have 7 accounts because WalletCreate implicitly creates the first one
 	// So this isn't a mistake
@@ -260,7 +260,7 @@ func TestAccountsList(t *testing.T) {
 
 	// Check that it fails if wallet is locked
 	MockWallet.EncryptWallet(wallet, "password")
-	_, _, err = MockWallet.AccountsList(wallet, 100)
+	_, err = MockWallet.AccountsList(wallet, 100)
 	assert.ErrorIs(t, ErrWalletLocked, err)
 }
 
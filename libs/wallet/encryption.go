@@ -146,25 +146,25 @@ func (w *NanoWallet) UnlockWallet(wallet *ent.Wallet, password string) (bool, er
 		return false, ErrBadPassword
 	}
 
-	err = SetDecryptedKeyToStorage(wallet, "seed", seed)
-	if err != nil {
-		return false, err
-	}
-
 	// Every adhoc account gets decrypted too
 	adhocAccts, err := w.DB.Account.Query().Where(account.WalletID(wallet.ID), account.PrivateKeyNotNil()).All(w.Ctx)
 	if err != nil {
 		return false, err
 	}
+	keys := make(map[string]interface{}, len(adhocAccts)+1)
+	keys["seed"] = seed
 	for _, acct := range adhocAccts {
 		key, err := crypter.Decrypt(*acct.PrivateKey)
 		if err != nil {
 			return false, err
 		}
-		err = SetDecryptedKeyToStorage(wallet, acct.Address, key)
-		if err != nil {
-			return false, err
-		}
+		keys[acct.Address] = key
+	}
+
+	// Store everything in one round trip
+	err = SetDecryptedKeysToStorage(wallet, keys)
+	if err != nil {
+		return false, err
 	}
 
 	return true, nil
@@ -199,3 +199,14 @@ func SetDecryptedKeyToStorage(wallet *ent.Wallet, key string, seed string) error
 
 	return database.GetRedisDB().Hset(wallet.ID.String(), key, seed)
 }
+
+// Set multiple decrypted keys to storage at once
+func SetDecryptedKeysToStorage(wallet *ent.Wallet, keys map[string]interface{}) error {
+	if wallet == nil {
+		return ErrInvalidWallet
+	} else if !wallet.Encrypted {
+		return ErrWalletNotLocked
+	}
+
+	return database.GetRedisDB().HsetMulti(wallet.ID.String(), keys)
+}
@@ -85,6 +85,16 @@ func TestSetAndGetDecryptedFromStorage(t *testing.T) {
 	retrievedSeed, err = GetDecryptedKeyFromStorage(wallet, "seed")
 	assert.Nil(t, err)
 	assert.Equal(t, "1234", retrievedSeed)
+
+	// Set multiple keys at once
+	err = SetDecryptedKeysToStorage(wallet, map[string]interface{}{"seed": "5678", "nano_1234": "abcd"})
+	assert.Nil(t, err)
+	retrievedSeed, err = GetDecryptedKeyFromStorage(wallet, "seed")
+	assert.Nil(t, err)
+	assert.Equal(t, "5678", retrievedSeed)
+	retrievedKey, err := GetDecryptedKeyFromStorage(wallet, "nano_1234")
+	assert.Nil(t, err)
+	assert.Equal(t, "abcd", retrievedKey)
 }
 
 func TestUnlockWallet(t *testing.T) {
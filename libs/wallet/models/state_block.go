@@ -25,52 +25,71 @@ type StateBlock struct {
 	Banano         bool   `json:"-"`
 }
 
-func (b *StateBlock) computeHash() error {
-	h, err := blake2b.New256(nil)
-	if err != nil {
-		return err
-	}
-	h.Write(make([]byte, 31))
-	h.Write([]byte{6})
+// Field offsets of the state block hashables
+// preamble (32) | account (32) | previous (32) | representative (32) | balance (16) | link (32)
+const (
+	stateBlockAccountOffset        = 32
+	stateBlockPreviousOffset       = 64
+	stateBlockRepresentativeOffset = 96
+	stateBlockBalanceOffset        = 128
+	stateBlockLinkOffset           = 144
+	stateBlockHashablesSize        = 176
+)
+
+// Serializes the block into a single fixed buffer and hashes it in one call
+func (b *StateBlock) hashBytes() ([32]byte, error) {
+	var hashables [stateBlockHashablesSize]byte
+	// Preamble, 6 is the state block type
+	hashables[stateBlockAccountOffset-1] = 6
+
 	pubkey, err := utils.AddressToPub(b.Account, b.Banano)
 	if err != nil {
-		return err
+		return [32]byte{}, err
 	}
-	h.Write(pubkey)
-	previous, err := hex.DecodeString(b.Previous)
-	if err != nil {
-		return err
+	copy(hashables[stateBlockAccountOffset:stateBlockPreviousOffset], pubkey)
+	if len(b.Previous) != 64 {
+		return [32]byte{}, errors.New("Invalid previous")
+	}
+	if _, err := hex.Decode(hashables[stateBlockPreviousOffset:stateBlockRepresentativeOffset], []byte(b.Previous)); err != nil {
+		return [32]byte{}, err
 	}
-	h.Write(previous)
 	pubkey, err = utils.AddressToPub(b.Representative, b.Banano)
 	if err != nil {
-		return err
+		return [32]byte{}, err
 	}
-	h.Write(pubkey)
+	copy(hashables[stateBlockRepresentativeOffset:stateBlockBalanceOffset], pubkey)
 	// COnvert balance to big int
 	balance, ok := big.NewInt(0).SetString(b.Balance, 10)
-	if !ok {
-		return errors.New("Invalid balance")
+	// FillBytes panics if the balance doesn't fit in 128 bits
+	if !ok || balance.Sign() < 0 || balance.BitLen() > 128 {
+		return [32]byte{}, errors.New("Invalid balance")
+	}
+	balance.FillBytes(hashables[stateBlockBalanceOffset:stateBlockLinkOffset])
+	if len(b.Link) != 64 {
+		return [32]byte{}, errors.New("Invalid link")
 	}
-	h.Write(balance.FillBytes(make([]byte, 16)))
-	link, err := hex.DecodeString(b.Link)
+	if _, err := hex.Decode(hashables[stateBlockLinkOffset:], []byte(b.Link)); err != nil {
+		return [32]byte{}, err
+	}
+	return blake2b.Sum256(hashables[:]), nil
+}
+
+func (b *StateBlock) computeHash() error {
+	hash, err := b.hashBytes()
 	if err != nil {
 		return err
 	}
-	h.Write(link)
-	b.Hash = hex.EncodeToString(h.Sum(nil))
+	b.Hash = hex.EncodeToString(hash[:])
 	return nil
 }
 
 func (b *StateBlock) Sign(privateKey ed25519.PrivateKey) error {
-	if err := b.computeHash(); err != nil {
-		return err
-	}
-	hash, err := hex.DecodeString(b.Hash)
+	hash, err := b.hashBytes()
 	if err != nil {
 		return err
 	}
-	sig := ed25519.Sign(privateKey, hash)
+	b.Hash = hex.EncodeToString(hash[:])
+	sig := ed25519.Sign(privateKey, hash[:])
 	b.Signature = hex.EncodeToString(sig)
 	return nil
 }
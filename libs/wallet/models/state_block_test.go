@@ -27,6 +27,26 @@ func TestComputeBlockHash(t *testing.T) {
 	assert.Equal(t, "8ebeb9534a14e0b17b3cd4639721387dedac80789278b540ddbde2a0b267b6d0", sb.Hash)
 }
 
+func TestComputeBlockHashInvalid(t *testing.T) {
+	sb := StateBlock{
+		Account:        "xrb_3px37c9f6w361j65yoasrcs6wh3hmmyb6eacpis7dwzp8th4hbb9izgba51j",
+		Previous:       "e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855",
+		Representative: "xrb_3px37c9f6w361j65yoasrcs6wh3hmmyb6eacpis7dwzp8th4hbb9izgba51j",
+		// Doesn't fit in 128 bits
+		Balance: "340282366920938463463374607431768211456",
+		Link:    "d9dd06646f96474a46c57c13677812305120be228f39964e222c06ab89f63745",
+		Banano:  false,
+	}
+	err := sb.computeHash()
+	assert.ErrorContains(t, err, "Invalid balance")
+
+	sb.Balance = "340282366920938463463374607431768211455"
+	sb.Previous = "e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b8"
+	err = sb.computeHash()
+	assert.ErrorContains(t, err, "Invalid previous")
+	assert.Equal(t, "", sb.Hash)
+}
+
 func TestSignBlock(t *testing.T) {
 	sb := StateBlock{
 		Account:        "xrb_3px37c9f6w361j65yoasrcs6wh3hmmyb6eacpis7dwzp8th4hbb9izgba51j",
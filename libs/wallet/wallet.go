@@ -179,7 +179,7 @@ func (w *NanoWallet) WalletRepresentativeSet(wallet *ent.Wallet, representative
 	}
 
 	// Create and publish change blocks for every account on the wallet.
-	_, addresses, err := w.AccountsList(wallet, 0)
+	addresses, err := w.AccountsList(wallet, 0)
 	if err != nil {
 		return err
 	}